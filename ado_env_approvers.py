@@ -1,12 +1,211 @@
+import asyncio
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
 import json
 from decouple import config
-import sys
+from typing import Optional
+
+
+class AdoAuthError(Exception):
+    """
+    Raised when Azure DevOps rejects the personal access token (PAT) used for authentication.
+    """
+
+
+def _identity_picker_path(api_version: str) -> str:
+    return f"/_apis/IdentityPicker/Identities?api-version={api_version}-preview.1"
+
+
+def _environments_path(project: str, pipeline_env: str, api_version: str) -> str:
+    return f"/{project}/_apis/distributedtask/environments?name={pipeline_env}&api-version={api_version}"
+
+
+def _environment_checks_path(project: str, pipeline_env_id: str, api_version: str) -> str:
+    return f"/{project}/_environments/{pipeline_env_id}/checks?__rt=fps&api-version={api_version}"
+
+
+_CHECK_CONFIGURATIONS_API = "/_apis/pipelines/checks/configurations"
+
+
+def _check_configurations_path(project: str, api_version: str) -> str:
+    return f"/{project}{_CHECK_CONFIGURATIONS_API}?api-version={api_version}-preview.1"
+
+
+def _account_query(account: str) -> dict:
+    """
+    Returns:
+        dict: The IdentityPicker query body used to look up the given account.
+    """
+
+    return {
+        "query": account,
+        "identityTypes": ["user", "group"],
+        "operationScopes": ["ims", "source"]
+    }
+
+
+def _parse_account_id(payload: dict, account: str) -> str:
+    """
+    Extracts the account ID from an IdentityPicker response body.
+
+    Args:
+        payload (dict): The decoded IdentityPicker response.
+        account (str): The name of the ADO account that was looked up.
+
+    Returns:
+        str: The ID of the specified ADO account.
+    """
+
+    identities = payload['results'][0].get('identities', [])
+    if len(identities) == 0:
+        raise ValueError(f"No results found for account '{account}'")
+    elif len(identities) > 1:
+        raise ValueError(f"Multiple results found for account '{account}'")
+    return identities[0]['originId']
+
+
+def _parse_pipeline_env_id(payload: dict, pipeline_env: str) -> str:
+    """
+    Extracts the pipeline environment ID from a distributedtask environments response body.
+
+    Args:
+        payload (dict): The decoded environments response.
+        pipeline_env (str): The name of the ADO pipeline environment that was looked up.
+
+    Returns:
+        str: The ID of the specified ADO pipeline environment.
+    """
+
+    if payload['count'] == 0:
+        raise ValueError(f"No environment found with name {pipeline_env}")
+    return payload["value"][0]["id"]
+
+
+def _parse_approver_ids(payload: dict) -> list[str]:
+    """
+    Extracts the approver IDs from an environment checks response body.
+
+    Args:
+        payload (dict): The decoded environment checks response.
+
+    Returns:
+        list[str]: The IDs of the approvers assigned to the pipeline checks, empty if there are none.
+    """
+
+    check_data_list = payload.get("fps", {}).get("dataProviders", {}).get("data", {}) \
+        .get("ms.vss-pipelinechecks.checks-data-provider", {}).get("checkConfigurationDataList", []) or []
+    return [
+        approver["id"]
+        for check in check_data_list
+        for approver in check.get("checkConfiguration", {}).get("settings", {}).get("approvers", [])
+        if "id" in approver
+    ]
+
+
+def _approval_body_template(approval_guid: str, min_required_approvers: int, pipeline_env: str) -> dict:
+    """
+    Returns:
+        dict: The static part of the approval check payload, see `_build_approval_body`.
+    """
+
+    return {
+        "type": {
+            "id": approval_guid,
+            "name": "Approval"
+        },
+        "settings": {
+            "approvers": [],
+            "executionOrder": 1,
+            "instructions": "",
+            "blockedApprovers": [],
+            "minRequiredApprovers": min_required_approvers,
+            "requesterCannotBeApprover": False
+        },
+        "resource": {
+            "type": "environment",
+            "id": None,
+            "name": pipeline_env
+        },
+        "timeout": 43200
+    }
+
+
+def _build_approval_body(template: dict, account_id: str, pipeline_env_id: str) -> dict:
+    """
+    Builds the approval check payload from a template made by `_approval_body_template`.
+    Only the nested dicts holding per-call values are copied; the static parts are shared with the template.
+
+    Args:
+        template (dict): The static approval check payload.
+        account_id (str): The ID of the account to add as approver.
+        pipeline_env_id (str): The ID of the pipeline environment the check applies to.
+
+    Returns:
+        dict: The request body for the check configurations endpoint.
+    """
+
+    return {
+        **template,
+        "settings": {**template["settings"], "approvers": [{"id": account_id}]},
+        "resource": {**template["resource"], "id": pipeline_env_id}
+    }
+
+
+def _raise_for_auth(status_code: int):
+    """
+    Raises AdoAuthError if the status code means ADO rejected the PAT.
+    ADO answers an invalid PAT either with 401 or with a 203 sign-in page.
+
+    Args:
+        status_code (int): The HTTP status code of a response or batched sub-response.
+    """
+
+    if status_code in (401, 203):
+        raise AdoAuthError(f"Authentication failed with status {status_code}, verify your PAT token is correct")
+
+
+def _raise_for_status(response):
+    """
+    Raises for failed responses, reporting a rejected PAT as AdoAuthError.
+    `raise_for_status` alone lets the 203 sign-in page ADO returns for an invalid PAT through.
+
+    Args:
+        response (requests.Response | httpx.Response): The response to check.
+
+    Raises:
+        AdoAuthError: If the PAT was rejected.
+        requests.exceptions.HTTPError | httpx.HTTPStatusError: If the request failed for any other reason.
+    """
+
+    _raise_for_auth(response.status_code)
+    response.raise_for_status()
+
+
+class _CheckCreateSafeRetry(Retry):
+    """
+    Retry policy that never re-sends a check configuration create POST once it may have reached ADO.
+    Creating a check is not idempotent, so for that call only 429 responses and failures to connect
+    are retried; every other request gets the regular policy.
+    """
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if method == "POST" and url and _CHECK_CONFIGURATIONS_API in url:
+            if response is not None and response.status != 429:
+                raise MaxRetryError(_pool, url, ResponseError(ResponseError.SPECIFIC_ERROR.format(status_code=response.status)))
+            if error is not None and not self._is_connection_error(error):
+                raise MaxRetryError(_pool, url, error) from error
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
 
 class AdoEnvApprovers:
     """
     This class represents an object to manage Azure DevOps (ADO) environment approvers.
+    The instance holds a single `requests.Session` so consecutive ADO calls reuse the same
+    keep-alive connection. Use it as a context manager to close the session when done.
     
     Attributes:
         personal_access_token (str): The personal access token (PAT) for authenticating with ADO.
@@ -25,14 +224,20 @@ class AdoEnvApprovers:
         
         add_approvers_to_env(project):
             Adds approvers to the specified ADO pipeline environment.
+        
+        close():
+            Closes the underlying HTTP session. Called automatically when used as a context manager.
     """
     
     ADO_APPROVAL_GUID = "8C6F20A7-A545-4486-9777-F762FAFE0D4D"
     MIN_REQUIRED_APPROVERS = 1
     ADO_PERSONAL_ACCESS_TOKEN = config("ADO_PERSONAL_ACCESS_TOKEN")
     ADO_API_VERSION = "7.0"
+    REQUEST_TIMEOUT = (3.05, 30)
+    MAX_RETRIES = 3
+    _batch_unsupported_orgs: set[str] = set()
     
-    def __init__(self, personal_access_token: str, account: str, pipeline_env: str):
+    def __init__(self, personal_access_token: str, account: str, pipeline_env: str, use_batch: bool = False):
         """
         Initializes a new instance of the AdoEnvApprovers class with the specified parameters.
 
@@ -40,6 +245,9 @@ class AdoEnvApprovers:
             personal_access_token (str): The personal access token (PAT) for authenticating with ADO.
             account (str): The name of the ADO account to use.
             pipeline_env (str): The name of the ADO pipeline environment to manage.
+            use_batch (bool): Whether to try folding the account and environment lookups into one `$batch`
+                request. Off by default, since organizations without the endpoint pay an extra round-trip
+                the first time it is tried in a process.
         """
         
         self.organization_url = "https://dev.azure.com/ubaidce"
@@ -47,16 +255,46 @@ class AdoEnvApprovers:
         self.account = account
         self.pipeline_env = pipeline_env
         self.headers = {
-            "Content-Type": "application/json"
+            "Accept": "application/json"
         }
+        self.session = requests.Session()
+        self.session.auth = self.credentials
+        self.session.headers.update(self.headers)
+        retry = _CheckCreateSafeRetry(
+            total=self.MAX_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._account_id: Optional[str] = None
+        self._env_id_cache: dict[str, str] = {}
+        self._body_template = _approval_body_template(self.ADO_APPROVAL_GUID, self.MIN_REQUIRED_APPROVERS, self.pipeline_env)
+        self._batch_supported = use_batch and self.organization_url not in self._batch_unsupported_orgs
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the underlying HTTP session and releases its pooled connections.
+        """
+
+        self.session.close()
     
     def add_approvers_to_env_1(self, project):
-        url = f'{self.organization_url}/{project}/_apis/pipelines/checks/configurations?api-version={self.ADO_API_VERSION}-preview.1'
-        account_id = self.__get_account_id()
-        pipeline_env_id = self.__get_pipeline_env_id(project)
-        if account_id in self.__check_approver_presence(project):
+        url = f"{self.organization_url}{_check_configurations_path(project, self.ADO_API_VERSION)}"
+        account_id, pipeline_env_id = self.__resolve_ids(project)
+        if account_id in self.__check_approver_presence(project, pipeline_env_id):
             print(f"Account ({self.account} with {account_id}) already present in the approvers list for {self.pipeline_env} in {project}, skipping....")
-            sys.exit(1)
+            return None
         ADO_BRANCH_CONTROL_GUID = "fe1de3ee-a436-41b4-bb20-f6eb4cb879a7"
         body = {
                     "type": {
@@ -86,8 +324,8 @@ class AdoEnvApprovers:
                     "timeout": 43200
                     }
 
-        response = requests.post(url=url, headers=self.headers, data=json.dumps(body), auth=self.credentials)
-        response.raise_for_status()
+        response = self.session.post(url=url, json=body, timeout=self.REQUEST_TIMEOUT)
+        _raise_for_status(response)
         print(f"Successfully added {self.account} to the {self.pipeline_env} of {project}")
         return response.status_code
             
@@ -105,50 +343,112 @@ class AdoEnvApprovers:
                 project (str): The name or ID of the project containing the pipeline.
 
             Returns:
-                int: The HTTP status code of the API response.
+                int | None: The HTTP status code of the API response, or None if the account is already
+                an approver of the environment and nothing was sent.
 
             Raises:
                 requests.exceptions.HTTPError: If the API request fails.
+                AdoAuthError: If ADO rejects the personal access token.
 
         """
     
-        url = f'{self.organization_url}/{project}/_apis/pipelines/checks/configurations?api-version={self.ADO_API_VERSION}-preview.1'
-        account_id = self.__get_account_id()
-        pipeline_env_id = self.__get_pipeline_env_id(project)
-        if account_id in self.__check_approver_presence(project):
+        url = f"{self.organization_url}{_check_configurations_path(project, self.ADO_API_VERSION)}"
+        account_id, pipeline_env_id = self.__resolve_ids(project)
+        if account_id in self.__check_approver_presence(project, pipeline_env_id):
             print(f"Account ({self.account} with {account_id}) already present in the approvers list for {self.pipeline_env} in {project}, skipping....")
-            sys.exit(1)
-        body = {
-                "type": {
-                    "id": self.ADO_APPROVAL_GUID,
-                    "name": "Approval"
-                },
-                "settings": {
-                    "approvers": [
-                    {
-                        #"displayName": self.account,
-                        "id": account_id
-                        #"uniqueName": self.account
-                    }
-                    ],
-                    "executionOrder": 1,
-                    "instructions": "",
-                    "blockedApprovers": [],
-                    "minRequiredApprovers": self.MIN_REQUIRED_APPROVERS,
-                    "requesterCannotBeApprover": False
-                },
-                "resource": {
-                    "type": "environment",
-                    "id": pipeline_env_id,
-                    "name": self.pipeline_env
-                },
-                "timeout": 43200
-        }
-        response = requests.post(url=url, headers=self.headers, data=json.dumps(body), auth=self.credentials)
-        response.raise_for_status()
+            return None
+        body = _build_approval_body(self._body_template, account_id, pipeline_env_id)
+        response = self.session.post(url=url, json=body, timeout=self.REQUEST_TIMEOUT)
+        _raise_for_status(response)
         print(f"Successfully added {self.account} to the {self.pipeline_env} of {project}")
         return response.status_code
     
+    def __resolve_ids(self, project: str) -> tuple[str, str]:
+        """
+        Resolves the account ID and the pipeline environment ID for the given project.
+        With `use_batch` enabled and neither value cached, the two lookups are folded into a single `$batch`
+        request, falling back to one request per lookup if the organization does not support the batch endpoint.
+
+        Args:
+            project (str): The name of the ADO project to use.
+
+        Returns:
+            tuple[str, str]: The account ID and the pipeline environment ID.
+        """
+
+        if self._batch_supported and self._account_id is None and project not in self._env_id_cache:
+            responses = self.__batch([
+                {
+                    "httpMethod": "POST",
+                    "url": _identity_picker_path(self.ADO_API_VERSION),
+                    "headers": {**self.headers, "Content-Type": "application/json"},
+                    "body": _account_query(self.account)
+                },
+                {
+                    "httpMethod": "GET",
+                    "url": _environments_path(project, self.pipeline_env, self.ADO_API_VERSION),
+                    "headers": self.headers
+                }
+            ])
+            if responses is not None:
+                self._account_id = _parse_account_id(responses[0], self.account)
+                self._env_id_cache[project] = _parse_pipeline_env_id(responses[1], self.pipeline_env)
+        return self.__get_account_id(), self.__get_pipeline_env_id(project)
+
+    def __batch(self, sub_requests: list[dict]) -> Optional[list[dict]]:
+        """
+        Sends several ADO REST calls as one request to the organization's `$batch` endpoint.
+
+        Args:
+            sub_requests (list[dict]): The sub-requests, each with `httpMethod`, a `url` relative to the
+                organization and optional `headers` and `body`.
+
+        Returns:
+            list[dict] | None: The decoded body of each sub-response, in request order, or None if the
+            batch endpoint is not supported for this organization.
+
+        Raises:
+            AdoAuthError: If ADO rejects the PAT for the batch request or any of its sub-requests.
+            requests.exceptions.HTTPError: If the batch request or any of its sub-requests fails.
+        """
+
+        url = f"{self.organization_url}/_apis/$batch?api-version={self.ADO_API_VERSION}"
+        response = self.session.post(url=url, json={"requests": sub_requests}, timeout=self.REQUEST_TIMEOUT)
+        if response.status_code in (404, 405, 501):
+            return self.__disable_batch()
+        _raise_for_status(response)
+        try:
+            sub_responses = response.json().get("responses")
+        except (ValueError, AttributeError):
+            sub_responses = None
+        if not isinstance(sub_responses, list) or len(sub_responses) != len(sub_requests) or not all(
+            isinstance(sub_response, dict) and isinstance(sub_response.get("code"), int) for sub_response in sub_responses
+        ):
+            return self.__disable_batch()
+        bodies = []
+        for sub_request, sub_response in zip(sub_requests, sub_responses):
+            _raise_for_auth(sub_response["code"])
+            if sub_response["code"] >= 400:
+                raise requests.exceptions.HTTPError(
+                    f"{sub_response['code']} Error in batched {sub_request['httpMethod']} {sub_request['url']}",
+                    response=response
+                )
+            body = sub_response.get("body")
+            bodies.append(json.loads(body) if isinstance(body, str) else body)
+        return bodies
+
+    def __disable_batch(self) -> None:
+        """
+        Stops this and later instances for the same organization from trying the `$batch` endpoint.
+
+        Returns:
+            None: So callers can return it as "batch not supported".
+        """
+
+        self._batch_supported = False
+        self._batch_unsupported_orgs.add(self.organization_url)
+        return None
+
     def __get_personal_access_token(self):
         """        
         Returns:
@@ -157,74 +457,45 @@ class AdoEnvApprovers:
         
         return self.ADO_PERSONAL_ACCESS_TOKEN
     
-    def __check_approver_presence(self, project: str) -> list[str]:
+    def __check_approver_presence(self, project: str, pipeline_env_id: str) -> list[str]:
         """
             Checks if there are any approvers assigned to the pipeline checks for the specified project and environment.
             
             Args:
                 project: A string representing the name of the project to check.
+                pipeline_env_id: The ID of the pipeline environment within the project.
             
             Returns:
                 A list of strings representing the IDs of the approvers assigned to the pipeline checks.
                 If there are no approvers, an empty list is returned.
         """
         
-        url = f'{self.organization_url}/{project}/_environments/{self.__get_pipeline_env_id(project)}/checks?__rt=fps&api-version={self.ADO_API_VERSION}'
-        response = requests.get(url=url, headers=self.headers, auth=self.credentials)
-        approvers_list = []
-
-        try:
-            check_data_list = response.json()["fps"]["dataProviders"]['data']['ms.vss-pipelinechecks.checks-data-provider']["checkConfigurationDataList"]
-        except KeyError as e:
-            print(f"Error: {e}")
-            check_data_list = []
-        else:
-            for i in check_data_list:
-                try:
-                    approvers = i['checkConfiguration']['settings']['approvers']
-                except KeyError as e:
-                    print(f"Error: {e}")
-                    approvers = []
-                    
-                for j in approvers:
-                    try:
-                        approvers_list.append(j["id"])
-                    except KeyError as e:
-                        print(f"Error: {e}")
-                
-        finally:
-            return approvers_list
+        url = f"{self.organization_url}{_environment_checks_path(project, pipeline_env_id, self.ADO_API_VERSION)}"
+        response = self.session.get(url=url, timeout=self.REQUEST_TIMEOUT)
+        _raise_for_status(response)
+        return _parse_approver_ids(response.json())
         
     def __get_account_id(self):
         """
-        Gets the account ID for the specified ADO account.
+        Gets the account ID for the specified ADO account. The ID is looked up once per instance
+        and cached for subsequent calls.
         
         Returns:
             str: The ID of the specified ADO account.
         """
         
-        url = f"{self.organization_url}/_apis/IdentityPicker/Identities?api-version={self.ADO_API_VERSION}-preview.1"
-        body = {
-            "query": self.account,
-            "identityTypes": ["user", "group"],
-            "operationScopes": ["ims", "source"]
-        }
-        response = requests.post(url=url, headers=self.headers, data=json.dumps(body), auth=self.credentials)
-        response.raise_for_status()
-        if response.status_code != 200:
-            print("Verify your PAT token is correct")
-            sys.exit(1)
-        results = response.json()['results'][0].get('identities', [])
-        if len(results) == 0:
-            raise ValueError(f"No results found for account '{self.account}'")
-        elif len(results) > 1:
-            raise ValueError(f"Multiple results found for account '{self.account}'")
-        account_id = response.json()['results'][0]['identities'][0]['originId']
-        return account_id
-        
+        if self._account_id is not None:
+            return self._account_id
+        url = f"{self.organization_url}{_identity_picker_path(self.ADO_API_VERSION)}"
+        response = self.session.post(url=url, json=_account_query(self.account), timeout=self.REQUEST_TIMEOUT)
+        _raise_for_status(response)
+        self._account_id = _parse_account_id(response.json(), self.account)
+        return self._account_id
+
     def __get_pipeline_env_id(self, project: str):
         """
         Helper method to get the pipeline environment ID for the specified ADO project.
+        Results are cached per project for the lifetime of the instance.
         
         Args:
             project (str): The name of the ADO project to use.
@@ -233,20 +504,209 @@ class AdoEnvApprovers:
             str: The ID of the specified ADO pipeline environment.
         """
         
-        url = f"{self.organization_url}/{project}/_apis/distributedtask/environments?name={self.pipeline_env}&api-version={self.ADO_API_VERSION}"
-        response = requests.get(url=url, headers=self.headers, auth=self.credentials)
-        response.raise_for_status()
-        if response.json()['count'] == 0:
-            raise ValueError(f"No environment found with name {self.pipeline_env}")
-        pipeline_env_id = response.json()["value"][0]["id"]
+        if project in self._env_id_cache:
+            return self._env_id_cache[project]
+        url = f"{self.organization_url}{_environments_path(project, self.pipeline_env, self.ADO_API_VERSION)}"
+        response = self.session.get(url=url, timeout=self.REQUEST_TIMEOUT)
+        _raise_for_status(response)
+        pipeline_env_id = _parse_pipeline_env_id(response.json(), self.pipeline_env)
+        self._env_id_cache[project] = pipeline_env_id
         return pipeline_env_id
-      
-    
-    
-        
+
+
+class AsyncAdoEnvApprovers:
+    """
+    Asyncio counterpart of AdoEnvApprovers built on `httpx.AsyncClient`.
+
+    Independent lookups (account ID and pipeline environment ID) are issued concurrently,
+    so adding an approver costs one round-trip less than the blocking implementation.
+    Use it as an async context manager to close the client when done.
+
+    Attributes:
+        account (str): The name of the ADO account to use.
+        pipeline_env (str): The name of the ADO pipeline environment to manage.
+    """
+
+    ADO_APPROVAL_GUID = AdoEnvApprovers.ADO_APPROVAL_GUID
+    MIN_REQUIRED_APPROVERS = AdoEnvApprovers.MIN_REQUIRED_APPROVERS
+    ADO_PERSONAL_ACCESS_TOKEN = AdoEnvApprovers.ADO_PERSONAL_ACCESS_TOKEN
+    ADO_API_VERSION = AdoEnvApprovers.ADO_API_VERSION
+    REQUEST_TIMEOUT = httpx.Timeout(AdoEnvApprovers.REQUEST_TIMEOUT[1], connect=AdoEnvApprovers.REQUEST_TIMEOUT[0])
+    MAX_RETRIES = AdoEnvApprovers.MAX_RETRIES
+
+    def __init__(self, personal_access_token: str, account: str, pipeline_env: str):
+        """
+        Initializes a new instance of the AsyncAdoEnvApprovers class with the specified parameters.
+
+        Args:
+            personal_access_token (str): The personal access token (PAT) for authenticating with ADO.
+            account (str): The name of the ADO account to use.
+            pipeline_env (str): The name of the ADO pipeline environment to manage.
+        """
+
+        self.organization_url = "https://dev.azure.com/ubaidce"
+        self.credentials = httpx.BasicAuth("", self.ADO_PERSONAL_ACCESS_TOKEN)
+        self.account = account
+        self.pipeline_env = pipeline_env
+        self.headers = {
+            "Accept": "application/json"
+        }
+        self.client = httpx.AsyncClient(
+            auth=self.credentials,
+            headers=self.headers,
+            timeout=self.REQUEST_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(
+                retries=self.MAX_RETRIES,
+                limits=httpx.Limits(max_keepalive_connections=8)
+            )
+        )
+        self._account_id: Optional[str] = None
+        self._env_id_cache: dict[str, str] = {}
+        self._body_template = _approval_body_template(self.ADO_APPROVAL_GUID, self.MIN_REQUIRED_APPROVERS, self.pipeline_env)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Closes the underlying HTTP client and releases its pooled connections.
+        """
+
+        await self.client.aclose()
+
+    async def add_approvers_to_env(self, project):
+        """
+            Adds the current user as an approver to the specified pipeline environment in the given project.
+            The account ID and pipeline environment ID are resolved concurrently before the approval check is created.
+
+            Args:
+                project (str): The name or ID of the project containing the pipeline.
+
+            Returns:
+                int | None: The HTTP status code of the API response, or None if the account is already
+                an approver of the environment and nothing was sent.
+
+            Raises:
+                httpx.HTTPStatusError: If the API request fails.
+                AdoAuthError: If ADO rejects the personal access token.
+        """
+
+        url = f"{self.organization_url}{_check_configurations_path(project, self.ADO_API_VERSION)}"
+        account_id, pipeline_env_id = await asyncio.gather(
+            self.__get_account_id(),
+            self.__get_pipeline_env_id(project)
+        )
+        if account_id in await self.__check_approver_presence(project, pipeline_env_id):
+            print(f"Account ({self.account} with {account_id}) already present in the approvers list for {self.pipeline_env} in {project}, skipping....")
+            return None
+        body = _build_approval_body(self._body_template, account_id, pipeline_env_id)
+        response = await self.client.post(url=url, json=body)
+        _raise_for_status(response)
+        print(f"Successfully added {self.account} to the {self.pipeline_env} of {project}")
+        return response.status_code
+
+    async def add_many(self, projects: list[str], concurrency: int = 10) -> list:
+        """
+            Adds the current user as an approver to the pipeline environment of every given project.
+            Projects are processed concurrently over the instance's shared client, with at most
+            `concurrency` projects in flight at a time. The account ID is resolved once up front.
+            Repeated project names are processed once, since concurrent tasks for the same project would
+            all pass the approver presence check and each create a check.
+
+            Args:
+                projects (list[str]): The names or IDs of the projects to update.
+                concurrency (int): The maximum number of projects processed at the same time.
+
+            Returns:
+                list: One entry per given project, in order: the result of `add_approvers_to_env`, or the
+                exception raised for that project, so one failing project does not hide the others.
+                Repeated project names share the same entry.
+        """
+
+        await self.__get_account_id()
+        sem = asyncio.Semaphore(concurrency)
+
+        async def run_one(project):
+            async with sem:
+                return await self.add_approvers_to_env(project)
+
+        unique_projects = list(dict.fromkeys(projects))
+        results = await asyncio.gather(*[run_one(p) for p in unique_projects], return_exceptions=True)
+        results_by_project = dict(zip(unique_projects, results))
+        return [results_by_project[p] for p in projects]
+
+    async def __check_approver_presence(self, project: str, pipeline_env_id: str) -> list[str]:
+        """
+            Checks if there are any approvers assigned to the pipeline checks for the specified project and environment.
+
+            Args:
+                project: A string representing the name of the project to check.
+                pipeline_env_id: The ID of the pipeline environment within the project.
+
+            Returns:
+                A list of strings representing the IDs of the approvers assigned to the pipeline checks.
+                If there are no approvers, an empty list is returned.
+        """
+
+        url = f"{self.organization_url}{_environment_checks_path(project, pipeline_env_id, self.ADO_API_VERSION)}"
+        response = await self.client.get(url=url)
+        _raise_for_status(response)
+        return _parse_approver_ids(response.json())
+
+    async def __get_account_id(self):
+        """
+        Gets the account ID for the specified ADO account. The ID is looked up once per instance
+        and cached for subsequent calls.
+
+        Returns:
+            str: The ID of the specified ADO account.
+        """
+
+        if self._account_id is not None:
+            return self._account_id
+        url = f"{self.organization_url}{_identity_picker_path(self.ADO_API_VERSION)}"
+        response = await self.client.post(url=url, json=_account_query(self.account))
+        _raise_for_status(response)
+        self._account_id = _parse_account_id(response.json(), self.account)
+        return self._account_id
+
+    async def __get_pipeline_env_id(self, project: str):
+        """
+        Helper method to get the pipeline environment ID for the specified ADO project.
+        Results are cached per project for the lifetime of the instance.
+
+        Args:
+            project (str): The name of the ADO project to use.
+
+        Returns:
+            str: The ID of the specified ADO pipeline environment.
+        """
+
+        if project in self._env_id_cache:
+            return self._env_id_cache[project]
+        url = f"{self.organization_url}{_environments_path(project, self.pipeline_env, self.ADO_API_VERSION)}"
+        response = await self.client.get(url=url)
+        _raise_for_status(response)
+        pipeline_env_id = _parse_pipeline_env_id(response.json(), self.pipeline_env)
+        self._env_id_cache[project] = pipeline_env_id
+        return pipeline_env_id
+
+
 #debug
+async def main(projects: list[str]):
+    async with AsyncAdoEnvApprovers("dummy_pat", "ubaidce@gmail.com", "QA") as ado_instance:
+        results = await ado_instance.add_many(projects)
+    for project, result in zip(projects, results):
+        if isinstance(result, Exception):
+            print(f"Failed to update {project}: {result}")
+        elif result is None:
+            print(f"Nothing to do for {project}, approver already configured")
+
+
 if __name__ == '__main__':
-    ado_instance = AdoEnvApprovers("dummy_pat", "ubaidce@gmail.com", "QA")
-    ado_instance.add_approvers_to_env_1("ado-env-approver-code")
+    asyncio.run(main(["ado-env-approver-code"]))
     
 